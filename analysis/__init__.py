@@ -1,8 +1,25 @@
-"""Top-level package for the 9layer audio analysis tooling."""
+"""Top-level package for the 9layer audio analysis tooling.
 
-from .config import AnalysisSettings, get_settings
-from .metadata import TrackAnalysisResult
-from .pipeline import AnalysisPipeline
+Public names are resolved lazily so importing a single submodule (for example
+``analysis.highlevel_extract``) does not drag in psycopg and the pipeline.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - static analysers only
+    from .config import AnalysisSettings, get_settings
+    from .metadata import TrackAnalysisResult
+    from .pipeline import AnalysisPipeline
+
+_EXPORTS = {
+    "AnalysisPipeline": ".pipeline",
+    "AnalysisSettings": ".config",
+    "TrackAnalysisResult": ".metadata",
+    "get_settings": ".config",
+}
 
 __all__ = [
     "AnalysisPipeline",
@@ -10,3 +27,14 @@ __all__ = [
     "TrackAnalysisResult",
     "get_settings",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name on first access and cache it on the package."""
+
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -16,7 +16,6 @@ from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
 from .config import AnalysisSettings, get_settings
-from .essentia_adapter import EssentiaConfig, EssentiaNotAvailableError
 from .metadata import TrackAnalysisResult
 from .storage import AnalysisStorage, TrackForAnalysis
 
@@ -65,7 +64,7 @@ def _initialise_worker(config: PipelineConfig, model_dir: Optional[str]) -> None
     if _WORKER_ADAPTER is not None:
         return
 
-    from .essentia_adapter import EssentiaAdapter  # Imported lazily for worker fork
+    from .essentia_adapter import EssentiaAdapter, EssentiaConfig  # Imported lazily for worker fork
 
     adapter_config = EssentiaConfig(
         model_dir=Path(model_dir) if model_dir else None,
@@ -210,9 +209,10 @@ class AnalysisPipeline:
             LOGGER.warning("Skipping track without file", extra={"track_id": track.track_id})
             return
 
-        try:
-            from .essentia_adapter import EssentiaAdapter
+        # Essentia and numpy are heavy; only pay for them once analysis actually runs.
+        from .essentia_adapter import EssentiaAdapter, EssentiaConfig, EssentiaNotAvailableError
 
+        try:
             adapter = EssentiaAdapter(
                 EssentiaConfig(
                     model_dir=Path(self.settings.model_dir) if self.settings.model_dir else None,
@@ -244,9 +244,8 @@ class AnalysisPipeline:
         summary.saved += 1
 
     def _store_payload(self, storage_payload: Dict[str, object]) -> None:
-        """Persist analysis results and mark any previous failures resolved."""
+        """Persist analysis results; saving also marks any previous failure resolved."""
 
         result = TrackAnalysisResult.from_storage_payload(storage_payload)
         self._storage.save_analysis(result)
-        self._storage.resolve_failure(result.track_id)
 
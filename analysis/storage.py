@@ -10,11 +10,10 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import List, Optional, Sequence, Tuple
 from uuid import uuid4
 
 import psycopg
-from psycopg.rows import dict_row
 from psycopg.types.json import Json
 
 from .metadata import TrackAnalysisResult
@@ -242,6 +241,7 @@ class AnalysisStorage:
             SET resolved = TRUE,
                 "occurredAt" = CURRENT_TIMESTAMP
             WHERE "trackId" = %(track_id)s
+              AND resolved = FALSE
         """
 
         with self._conn.cursor() as cur:
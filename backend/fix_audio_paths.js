@@ -4,8 +4,10 @@ const path = require('path');
 
 const prisma = new PrismaClient();
 
+// Music root (DOWNLOAD_DIR or the legacy default)
+const MUSIC_DIR = path.resolve(process.env.DOWNLOAD_DIR || '/Volumes/2TB/coding tools/9layer/music');
+
 async function findWorkingAudioFiles() {
-    const musicDir = '/Volumes/2TB/coding tools/9layer/music';
     const audioFiles = [];
     
     console.log('🔍 Scanning for audio files...');
@@ -15,16 +17,25 @@ async function findWorkingAudioFiles() {
         if (audioFiles.length >= maxFiles) return;
         
         try {
-            const items = fs.readdirSync(dir);
-            for (const item of items) {
+            // Dirent types come from readdir itself; only symlinks and .mp3 files need a stat
+            const entries = fs.readdirSync(dir, { withFileTypes: true });
+            for (const entry of entries) {
                 if (audioFiles.length >= maxFiles) break;
                 
+                const item = entry.name;
                 const fullPath = path.join(dir, item);
-                const stat = fs.statSync(fullPath);
+                const isDirectory = entry.isSymbolicLink()
+                    ? fs.statSync(fullPath).isDirectory()
+                    : entry.isDirectory();
                 
-                if (stat.isDirectory()) {
+                if (isDirectory) {
                     scanDirectory(fullPath, maxFiles);
-                } else if (item.endsWith('.mp3') && stat.size > 1000) { // Only files > 1KB
+                    continue;
+                }
+                if (!item.endsWith('.mp3')) continue;
+                
+                const stat = fs.statSync(fullPath);
+                if (stat.isFile() && stat.size > 1000) { // Only files > 1KB
                     audioFiles.push({
                         path: fullPath,
                         size: stat.size,
@@ -39,7 +50,7 @@ async function findWorkingAudioFiles() {
         }
     }
     
-    scanDirectory(musicDir);
+    scanDirectory(MUSIC_DIR);
     return audioFiles;
 }
 
@@ -63,21 +74,23 @@ async function updateDatabasePaths() {
         
         console.log(`📊 Found ${tracks.length} tracks in database`);
         
-        // Update tracks with working file paths
-        for (let i = 0; i < Math.min(tracks.length, audioFiles.length); i++) {
-            const track = tracks[i];
-            const audioFile = audioFiles[i];
-            
-            console.log(`🔄 Updating track ${track.id}: ${track.title}`);
-            console.log(`   New path: ${audioFile.path}`);
-            
-            await prisma.track.update({
-                where: { id: track.id },
+        // Update tracks with working file paths in one transaction
+        const count = Math.min(tracks.length, audioFiles.length);
+        const updates = [];
+        for (let i = 0; i < count; i++) {
+            updates.push(prisma.track.update({
+                where: { id: tracks[i].id },
                 data: {
-                    filePath: audioFile.path,
-                    fileSize: audioFile.size
+                    filePath: audioFiles[i].path,
+                    fileSize: audioFiles[i].size
                 }
-            });
+            }));
+        }
+        await prisma.$transaction(updates);
+        
+        for (let i = 0; i < count; i++) {
+            console.log(`🔄 Updated track ${tracks[i].id}: ${tracks[i].title}`);
+            console.log(`   New path: ${audioFiles[i].path}`);
         }
         
         console.log('✅ Database updated successfully');
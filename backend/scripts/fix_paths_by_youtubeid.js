@@ -21,37 +21,55 @@ function parseArgs() {
   return opts;
 }
 
-function shFind(cmd) {
-  // Ensure non-zero exits (e.g., permission denials) don't break us
-  const safeCmd = `${cmd} 2>/dev/null || true`;
-  return new Promise((resolve) => {
-    execFile("bash", ["-lc", safeCmd], { maxBuffer: 1024 * 1024 }, (err, stdout) => {
-      if (err) return resolve(null);
-      const out = stdout.toString().trim();
+const AUDIO_EXTENSIONS = ["mp3", "webm", "m4a", "ogg", "opus", "wav", "flac"];
+
+// find(1) arguments listing every audio file (>1k) under root
+function findArgs(root) {
+  const nameTests = [];
+  for (const ext of AUDIO_EXTENSIONS) {
+    if (nameTests.length) nameTests.push("-o");
+    nameTests.push("-iname", `*.${ext}`);
+  }
+  return [root, "-type", "f", "(", ...nameTests, ")", "-size", "+1k", "-print"];
+}
+
+function runFind(args, maxBuffer = 1024 * 1024) {
+  // find exits 1 on partial failures (e.g., permission denials) with usable stdout.
+  // Anything else (buffer overflow, kill signal, missing binary) would leave a
+  // truncated listing, so fail instead.
+  return new Promise((resolve, reject) => {
+    execFile("find", args, { maxBuffer }, (err, stdout) => {
+      if (err && err.code !== 1) {
+        reject(new Error(`find failed (${err.code || err.signal}): ${err.message}`));
+        return;
+      }
+      const out = (stdout || "").toString().trim();
       resolve(out || null);
     });
   });
 }
 
-function findByYoutubeId(root, youtubeId) {
-  return new Promise((resolve) => {
-    if (!youtubeId) return resolve(null);
-    // Many downloaders save files as: "<artist> - <title> [<youtubeId>].ext"
-    // So we search for any filename containing the youtubeId and ending with supported audio extensions
-    const pattern = `*${youtubeId}*`;
-    const cmd = `find ${JSON.stringify(root)} -type f \
-      \\( \
-        -iname ${JSON.stringify(pattern + ".mp3")} -o \
-        -iname ${JSON.stringify(pattern + ".webm")} -o \
-        -iname ${JSON.stringify(pattern + ".m4a")} -o \
-        -iname ${JSON.stringify(pattern + ".ogg")} -o \
-        -iname ${JSON.stringify(pattern + ".opus")} -o \
-        -iname ${JSON.stringify(pattern + ".wav")} -o \
-        -iname ${JSON.stringify(pattern + ".flac")} \
-      \\) \
-      -size +1k -print -quit`;
-    shFind(cmd).then((found) => resolve(found));
+// Case-insensitive equivalent of `find -iname "*a*b*.ext" -quit` over the prebuilt
+// index: the first file whose name (without extension) contains each part in order
+function findInIndex(index, parts) {
+  const needles = parts.map((p) => p.toLowerCase());
+  const hit = index.find((file) => {
+    let from = 0;
+    for (const needle of needles) {
+      const at = file.stem.indexOf(needle, from);
+      if (at === -1) return false;
+      from = at + needle.length;
+    }
+    return true;
   });
+  return hit ? hit.path : null;
+}
+
+function findByYoutubeId(index, youtubeId) {
+  if (!youtubeId) return null;
+  // Many downloaders save files as: "<artist> - <title> [<youtubeId>].ext"
+  // So we search for any filename containing the youtubeId
+  return findInIndex(index, [youtubeId]);
 }
 
 function normalize(str) {
@@ -62,7 +80,7 @@ function normalize(str) {
     .replace(/\s+/g, " ");
 }
 
-async function findByHeuristics(root, t) {
+function findByHeuristics(root, index, t) {
   // 1) If existing filePath is under an old root, try prefix replace
   const prefixes = [
     "/Volumes/3ool0ne 2TB",
@@ -81,19 +99,7 @@ async function findByHeuristics(root, t) {
   if (t.filePath) {
     const base = path.basename(t.filePath).replace(/\.[^.]+$/, "");
     if (base) {
-      const pattern = `*${base}*`;
-      const cmd = `find ${JSON.stringify(root)} -type f \
-        \\( \
-          -iname ${JSON.stringify(pattern + ".mp3")} -o \
-          -iname ${JSON.stringify(pattern + ".webm")} -o \
-          -iname ${JSON.stringify(pattern + ".m4a")} -o \
-          -iname ${JSON.stringify(pattern + ".ogg")} -o \
-          -iname ${JSON.stringify(pattern + ".opus")} -o \
-          -iname ${JSON.stringify(pattern + ".wav")} -o \
-          -iname ${JSON.stringify(pattern + ".flac")} \
-        \\) \
-        -size +1k -print -quit`;
-      const found = await shFind(cmd);
+      const found = findInIndex(index, [base]);
       if (found) return found;
     }
   }
@@ -103,19 +109,7 @@ async function findByHeuristics(root, t) {
   if (combo) {
     const parts = combo.split(" ").filter(Boolean).slice(0, 5); // limit pattern size
     if (parts.length) {
-      const pattern = `*${parts.join("*")}*`;
-      const cmd = `find ${JSON.stringify(root)} -type f \
-        \\( \
-          -iname ${JSON.stringify(pattern + ".mp3")} -o \
-          -iname ${JSON.stringify(pattern + ".webm")} -o \
-          -iname ${JSON.stringify(pattern + ".m4a")} -o \
-          -iname ${JSON.stringify(pattern + ".ogg")} -o \
-          -iname ${JSON.stringify(pattern + ".opus")} -o \
-          -iname ${JSON.stringify(pattern + ".wav")} -o \
-          -iname ${JSON.stringify(pattern + ".flac")} \
-        \\) \
-        -size +1k -print -quit`;
-      const found = await shFind(cmd);
+      const found = findInIndex(index, parts);
       if (found) return found;
     }
   }
@@ -132,22 +126,23 @@ async function main() {
   }
   const prisma = new PrismaClient();
   try {
-    // Build a searchable index of candidate files once (faster than many find calls)
+    // Index of every candidate audio file under root; all per-track lookups use it
     console.log("Indexing audio files under", opts.root, "(this may take a moment)...");
-    const listCmd = `find ${JSON.stringify(opts.root)} -type f \
-      \\( \
-        -iname "*.mp3" -o \
-        -iname "*.webm" -o \
-        -iname "*.m4a" -o \
-        -iname "*.ogg" -o \
-        -iname "*.opus" -o \
-        -iname "*.wav" -o \
-        -iname "*.flac" \
-      \\) -size +1k -print`;
-    const allFilesRaw = await shFind(listCmd);
+    const allFilesRaw = await runFind(findArgs(opts.root), 256 * 1024 * 1024);
     const allFiles = (allFilesRaw ? allFilesRaw.split(/\n+/) : []).filter(Boolean);
     console.log(`Indexed ${allFiles.length} files`);
 
+    // Normalize directory and file names once; the lookups scan this for every track
+    const indexedFiles = allFiles.map((fp) => {
+      const stem = path.basename(fp).replace(/\.[^.]+$/, "");
+      return {
+        path: fp,
+        dir: normalize(path.dirname(fp).split('/').pop() || ''),
+        name: normalize(stem),
+        stem: stem.toLowerCase(),
+      };
+    });
+
     function getArtistName(t) {
       if (!t) return '';
       const a = t.artist;
@@ -173,22 +168,18 @@ async function main() {
       const artistName = getArtistName(t);
       const artistDir = artistName ? normalize(artistName) : null;
       
+      const comboWords = combos.map((combo) => combo.split(" ").filter(Boolean));
+
       // Try to find unique matches by checking filename (without extension) normalized contains all words in combo
       const matches = [];
-      for (const fp of allFiles) {
+      for (const file of indexedFiles) {
         // For non-youtubeId matches, require artist directory match to avoid cross-artist errors
-        if (!t.youtubeId && artistDir) {
-          const dirName = path.dirname(fp).split('/').pop()?.toLowerCase() || '';
-          if (normalize(dirName) !== artistDir) continue; // Skip if directory doesn't match artist
-        }
-        
-        const base = path.basename(fp).replace(/\.[^.]+$/, "");
-        const norm = normalize(base);
-        for (const combo of combos) {
-          const words = combo.split(" ").filter(Boolean);
+        if (!t.youtubeId && artistDir && file.dir !== artistDir) continue;
+
+        for (const words of comboWords) {
           let ok = true;
-          for (const w of words) { if (!norm.includes(w)) { ok = false; break; } }
-          if (ok) { matches.push(fp); break; }
+          for (const w of words) { if (!file.name.includes(w)) { ok = false; break; } }
+          if (ok) { matches.push(file.path); break; }
         }
       }
       // Prefer unique match; otherwise ambiguous -> skip
@@ -209,10 +200,10 @@ async function main() {
     let toUpdate = [];
 
     for (const t of tracks) {
-      let found = await findByYoutubeId(opts.root, t.youtubeId);
+      let found = findByYoutubeId(indexedFiles, t.youtubeId);
       let matchReason = 'youtubeId';
       if (!found) {
-        found = await findByHeuristics(opts.root, t);
+        found = findByHeuristics(opts.root, indexedFiles, t);
         matchReason = 'heuristic';
       }
       if (!found) {
@@ -1,10 +1,14 @@
 const { PrismaClient } = require('@prisma/client');
 const fs = require('fs');
 const path = require('path');
-const { exec } = require('child_process');
+const os = require('os');
+const { execFile } = require('child_process');
 const { promisify } = require('util');
 
-const execAsync = promisify(exec);
+const execFileAsync = promisify(execFile);
+const FFPROBE_TIMEOUT_MS = 10000;
+// ffprobe runs are process-start and disk bound, so overlap a few per core
+const FFPROBE_CONCURRENCY = Math.max(1, parseInt(process.env.FFPROBE_CONCURRENCY, 10) || os.cpus().length * 2);
 const prisma = new PrismaClient();
 
 /**
@@ -17,8 +21,12 @@ async function getAudioDuration(filePath) {
       return null;
     }
 
-    const command = `ffprobe -v quiet -show_entries format=duration -of csv=p=0 "${filePath}"`;
-    const { stdout } = await execAsync(command);
+    // Spawn ffprobe directly (no shell) and give up on files that stall it
+    const { stdout } = await execFileAsync(
+      'ffprobe',
+      ['-v', 'quiet', '-show_entries', 'format=duration', '-of', 'csv=p=0', filePath],
+      { timeout: FFPROBE_TIMEOUT_MS }
+    );
     const duration = parseFloat(stdout.trim());
     
     return isNaN(duration) ? null : Math.round(duration);
@@ -52,24 +60,25 @@ async function fixTrackDurations() {
 
     let updated = 0;
     let failed = 0;
+    let nextIndex = 0;
 
-    for (const track of tracks) {
+    async function processTrack(track) {
       console.log(`🔍 Processing: ${track.title}`);
-      
+
       if (!track.filePath) {
         console.warn(`⚠️  No file path for track: ${track.title}`);
         failed++;
-        continue;
+        return;
       }
 
       const duration = await getAudioDuration(track.filePath);
-      
+
       if (duration !== null) {
         await prisma.track.update({
           where: { id: track.id },
           data: { duration }
         });
-        
+
         console.log(`✅ Updated ${track.title}: ${duration}s`);
         updated++;
       } else {
@@ -78,6 +87,16 @@ async function fixTrackDurations() {
       }
     }
 
+    // Fixed pool of workers pulling from a shared cursor
+    async function worker() {
+      while (nextIndex < tracks.length) {
+        await processTrack(tracks[nextIndex++]);
+      }
+    }
+
+    const workerCount = Math.min(FFPROBE_CONCURRENCY, tracks.length);
+    await Promise.all(Array.from({ length: workerCount }, worker));
+
     console.log('\n📈 Summary:');
     console.log(`✅ Updated: ${updated} tracks`);
     console.log(`❌ Failed: ${failed} tracks`);
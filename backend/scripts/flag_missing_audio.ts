@@ -18,6 +18,8 @@ function parseArgs(): Options {
     else if (arg === '--chunk') opts.chunk = parseInt(args[++i] ?? '250', 10);
     else if (arg === '--json') opts.json = args[++i] ?? null;
   }
+  // A non-positive or non-numeric chunk would never advance the batch loops
+  if (!Number.isInteger(opts.chunk) || opts.chunk <= 0) opts.chunk = 250;
   return opts;
 }
 
@@ -89,16 +91,17 @@ async function run() {
       return;
     }
 
+    // Every missing track gets the same values, so clear them with one
+    // UPDATE ... WHERE id IN (...) per chunk
     let updated = 0;
-    for (const track of missing) {
-      await prisma.track.update({
-        where: { id: track.id },
+    for (let i = 0; i < missing.length; i += options.chunk) {
+      const ids = missing.slice(i, i + options.chunk).map(track => track.id);
+      const result = await prisma.track.updateMany({
+        where: { id: { in: ids } },
         data: { filePath: null, fileSize: null }
       });
-      updated++;
-      if (updated % 50 === 0) {
-        console.log(`Updated ${updated}/${missing.length}`);
-      }
+      updated += result.count;
+      console.log(`Updated ${updated}/${missing.length}`);
     }
     console.log(`Updated ${updated} tracks. All missing file paths set to null.`);
   } catch (err) {
@@ -2,14 +2,7 @@
 /*
   Redownload missing tracks by reading missing_tracks.json and calling the backend downloader.
 
-  Usage:
-    node backend-ts/scripts/redownload_missing_from_json.js \
-      --input missing_tracks.json \
-      [--limit 50] \
-      [--concurrency 2] \
-      [--dry-run] \
-      [--artist "Artist Name"] \
-      [--album "Album Title"]
+  Usage: see USAGE below (also printed on invalid arguments).
 
   Notes:
   - Expects backend TypeScript server running on http://localhost:8000
@@ -19,29 +12,50 @@
 
 const fs = require('fs');
 const path = require('path');
+const { parseArgs: parseCliArgs } = require('util');
+
+const USAGE = `Usage:
+  node backend/scripts/redownload_missing_from_json.js \\
+    --input missing_tracks.json \\
+    [--limit 50] \\
+    [--concurrency 2] \\
+    [--dry-run] \\
+    [--artist "Artist Name"] \\
+    [--album "Album Title"] \\
+    [--base-url http://localhost:8000]
+
+Values that begin with a dash must use the "=" form, e.g. --artist=-M-`;
 
 function parseArgs() {
-  const args = process.argv.slice(2);
-  const opts = {
-    input: 'missing_tracks.json',
-    limit: 0,
-    concurrency: 2,
-    dryRun: false,
-    artist: null,
-    album: null,
-    baseUrl: process.env.DOWNLOAD_BASE_URL || 'http://localhost:8000',
-  };
-  for (let i = 0; i < args.length; i++) {
-    const a = args[i];
-    if (a === '--input') opts.input = args[++i];
-    else if (a === '--limit') opts.limit = parseInt(args[++i], 10) || 0;
-    else if (a === '--concurrency') opts.concurrency = parseInt(args[++i], 10) || 2;
-    else if (a === '--dry-run') opts.dryRun = true;
-    else if (a === '--artist') opts.artist = args[++i];
-    else if (a === '--album') opts.album = args[++i];
-    else if (a === '--base-url') opts.baseUrl = args[++i];
+  // util.parseArgs handles both "--flag value" and "--flag=value" in one pass
+  let values;
+  try {
+    ({ values } = parseCliArgs({
+      args: process.argv.slice(2),
+      options: {
+        input: { type: 'string', default: 'missing_tracks.json' },
+        limit: { type: 'string' },
+        concurrency: { type: 'string' },
+        'dry-run': { type: 'boolean', default: false },
+        artist: { type: 'string' },
+        album: { type: 'string' },
+        'base-url': { type: 'string', default: process.env.DOWNLOAD_BASE_URL || 'http://localhost:8000' },
+      },
+    }));
+  } catch (e) {
+    console.error(e.message);
+    console.error(USAGE);
+    process.exit(1);
   }
-  return opts;
+  return {
+    input: values.input,
+    limit: parseInt(values.limit, 10) || 0,
+    concurrency: parseInt(values.concurrency, 10) || 2,
+    dryRun: values['dry-run'],
+    artist: values.artist ?? null,
+    album: values.album ?? null,
+    baseUrl: values['base-url'],
+  };
 }
 
 function loadItems(file) {
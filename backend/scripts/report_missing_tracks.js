@@ -49,12 +49,11 @@ async function main() {
 
       // Try alternate extensions in the same directory using the same basename
       try {
-        const dir = path.dirname(t.filePath);
-        const base = path.basename(t.filePath, path.extname(t.filePath));
+        // Track path without its extension; candidates append each alternate extension
+        const stem = t.filePath.slice(0, t.filePath.length - path.extname(t.filePath).length);
         let found = false;
         for (const ext of altExts) {
-          const candidate = path.join(dir, base + ext);
-          if (fs.existsSync(candidate)) { found = true; break; }
+          if (fs.existsSync(stem + ext)) { found = true; break; }
         }
         if (!found) missing.push(t);
       } catch {
@@ -83,24 +82,23 @@ async function main() {
 
       // Build metadata
       const byArtistCount = new Map();
-      const byAlbumCount = new Map(); // key: artist|||album
-      for (const t of items) {
-        const artistName = t.artist || 'Unknown Artist';
+      const byAlbumCount = new Map(); // key: albumId
+      for (const t of missing) {
+        const artistName = t.artist?.name || 'Unknown Artist';
         byArtistCount.set(artistName, (byArtistCount.get(artistName) || 0) + 1);
-        const albumTitle = t.album || 'Unknown Album';
-        const key = `${artistName}|||${albumTitle}`;
-        byAlbumCount.set(key, (byAlbumCount.get(key) || 0) + 1);
+        const entry = byAlbumCount.get(t.albumId);
+        if (entry) {
+          entry.count++;
+        } else {
+          byAlbumCount.set(t.albumId, { artist: artistName, album: t.album?.title || 'Unknown Album', count: 1 });
+        }
       }
 
       const byArtist = Array.from(byArtistCount.entries())
         .map(([artist, count]) => ({ artist, count }))
         .sort((a, b) => a.artist.localeCompare(b.artist));
 
-      const byAlbum = Array.from(byAlbumCount.entries())
-        .map(([key, count]) => {
-          const [artist, album] = key.split('|||');
-          return { artist, album, count };
-        })
+      const byAlbum = Array.from(byAlbumCount.values())
         .sort((a, b) => a.artist === b.artist ? a.album.localeCompare(b.album) : a.artist.localeCompare(b.artist));
 
       const meta = {
@@ -10,6 +10,7 @@ import { websocketRoutes } from './routes/websocket.routes';
 import { analyticsRoutes } from './routes/analytics.routes';
 import { analysisRoutes } from './routes/analysis.routes';
 import { AudioAnalysisService } from './services/audio-analysis.service';
+import { PlaybackService } from './services/playback.service';
 import path from 'path';
 
 // Extend Fastify types to include Prisma
@@ -17,6 +18,7 @@ declare module 'fastify' {
   interface FastifyInstance {
     prisma: PrismaClient;
     audioAnalysisService: AudioAnalysisService;
+    playbackService: PlaybackService;
   }
 }
 
@@ -33,10 +35,13 @@ const app = Fastify({
 // Initialize Prisma client
 const prisma = new PrismaClient();
 const audioAnalysisService = new AudioAnalysisService();
+// One player shared by the HTTP and WebSocket routes
+const playbackService = new PlaybackService(prisma);
 
 // Add Prisma to the app instance for use in routes
 app.decorate('prisma', prisma);
 app.decorate('audioAnalysisService', audioAnalysisService);
+app.decorate('playbackService', playbackService);
 
 // Register plugins
 async function registerPlugins() {
@@ -106,7 +111,20 @@ async function registerRoutes() {
 }
 
 // Basic health check endpoint
-app.get('/health', async () => {
+app.get('/health', {
+  schema: {
+    response: {
+      200: {
+        type: 'object',
+        properties: {
+          status: { type: 'string' },
+          timestamp: { type: 'string' },
+          environment: { type: 'string' },
+        },
+      },
+    },
+  },
+}, async () => {
   return {
     status: 'ok',
     timestamp: new Date().toISOString(),
@@ -4,6 +4,24 @@ import { PrismaClient } from '@prisma/client';
 import { DownloadOptions } from '../types/api.types';
 /// <reference path="../types/fastify.d.ts" />
 
+/**
+ * Normalize a playlist/track album name, rejecting placeholders such as
+ * "Unknown Album", auto-generated playlist titles and raw playlist IDs.
+ */
+function sanitizeAlbumName(name?: string | null): string | undefined {
+  if (typeof name !== 'string') return undefined;
+  const normalized = name.replace(/\u00A0/g, ' ').trim();
+  if (!normalized) return undefined;
+  const lower = normalized.toLowerCase();
+  if (lower === 'unknown album') return undefined;
+  if (lower === 'topic') return undefined;
+  if (lower.startsWith('playlist ')) return undefined;
+  if (lower.startsWith('uploads from ')) return undefined;
+  if (lower.startsWith('mix - ')) return undefined;
+  if (/^ol[a-z0-9_\-]{8,}$/i.test(lower.replace(/[^a-z0-9]/g, ''))) return undefined;
+  return normalized;
+}
+
 /**
  * Download routes for the 9layer backend
  */
@@ -26,7 +44,7 @@ export async function downloadRoutes(fastify: FastifyInstance): Promise<void> {
         type: 'object',
         required: ['url'],
         properties: {
-          url: { type: 'string', format: 'uri' },
+          url: { type: 'string', format: 'uri', pattern: '^https?://' },
           quality: { type: 'string', enum: ['best', 'good', 'medium', 'worst'] },
           format: { type: 'string', enum: ['audio', 'video'] },
           outputDir: { type: 'string' },
@@ -167,7 +185,7 @@ export async function downloadRoutes(fastify: FastifyInstance): Promise<void> {
         type: 'object',
         required: ['url'],
         properties: {
-          url: { type: 'string', format: 'uri' },
+          url: { type: 'string', format: 'uri', pattern: '^https?://' },
           quality: { type: 'string', enum: ['best', 'good', 'medium', 'worst'] },
           format: { type: 'string', enum: ['audio', 'video'] }
         }
@@ -248,20 +266,6 @@ export async function downloadRoutes(fastify: FastifyInstance): Promise<void> {
 
       // Extract album name with better fallback logic
       // Try: playlist metadata album -> playlist title -> playlist ID from URL -> fallback
-      const sanitizeAlbumName = (name?: string | null): string | undefined => {
-        if (typeof name !== 'string') return undefined;
-        const normalized = name.replace(/\u00A0/g, ' ').trim();
-        if (!normalized) return undefined;
-        const lower = normalized.toLowerCase();
-        if (lower === 'unknown album') return undefined;
-        if (lower === 'topic') return undefined;
-        if (lower.startsWith('playlist ')) return undefined;
-        if (/^ol[a-z0-9_\-]{8,}$/i.test(lower.replace(/[^a-z0-9]/g, ''))) return undefined;
-        if (/^uploads from /.test(lower)) return undefined;
-        if (/^mix - /.test(lower)) return undefined;
-        return normalized;
-      };
-
       let albumName = sanitizeAlbumName(playlistInfo[0]?.album);
       let playlistMetadata: { title?: string; description?: string; uploader?: string } | null = null;
 
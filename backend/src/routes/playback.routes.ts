@@ -1,5 +1,4 @@
 import { FastifyInstance, FastifyRequest, FastifyReply } from 'fastify';
-import { PlaybackService } from '../services/playback.service';
 import { SearchService } from '../services/search.service';
 import { PrismaClient, Prisma } from '@prisma/client';
 import { Track } from '../types/api.types';
@@ -7,15 +6,66 @@ import * as fs from 'fs';
 import * as path from 'path';
 /// <reference path="../types/fastify.d.ts" />
 
+/**
+ * Response schema for a single track, shared by the routes that return track lists or a track
+ */
+const TRACK_SCHEMA = {
+  type: 'object',
+  properties: {
+    id: { type: 'string' },
+    title: { type: 'string' },
+    artist: { type: 'string' },
+    album: { type: 'string' },
+    artistId: { type: 'string' },
+    albumId: { type: 'string' },
+    duration: { type: 'number' },
+    filePath: { type: 'string' },
+    fileSize: { type: 'number' },
+    youtubeId: { type: 'string' },
+    likeability: { type: 'number' }
+  }
+};
+
 /**
  * Playback routes for the 9layer backend
  */
 export async function playbackRoutes(fastify: FastifyInstance): Promise<void> {
   // Get the Prisma client and initialize services
   const prisma = fastify.prisma as PrismaClient;
-  const playbackService = new PlaybackService(prisma);
+  const playbackService = fastify.playbackService;
   const searchService = new SearchService(prisma);
 
+  // Stat a file, or null when it is missing
+  async function statFile(filePath: string): Promise<fs.Stats | null> {
+    try {
+      return await fs.promises.stat(filePath);
+    } catch {
+      return null;
+    }
+  }
+
+  // Update and read back a track's flag fields in one statement; Prisma reports a
+  // missing row as P2025, which is returned as null
+  async function updateTrackOrNull(trackId: string, data: Prisma.TrackUpdateInput) {
+    try {
+      return await prisma.track.update({
+        where: { id: trackId },
+        data,
+        select: {
+          id: true,
+          title: true,
+          incorrectMatch: true,
+          incorrectFlaggedAt: true
+        }
+      });
+    } catch (error) {
+      if (error instanceof Prisma.PrismaClientKnownRequestError && error.code === 'P2025') {
+        return null;
+      }
+      throw error;
+    }
+  }
+
   // Small helper to determine content-type by file extension
   function contentTypeFor(filePath: string): string {
     const ext = path.extname(filePath).toLowerCase();
@@ -93,22 +143,7 @@ export async function playbackRoutes(fastify: FastifyInstance): Promise<void> {
                 },
                 tracks: {
                   type: 'array',
-                  items: {
-                    type: 'object',
-                    properties: {
-                      id: { type: 'string' },
-                      title: { type: 'string' },
-                      artist: { type: 'string' },
-                      album: { type: 'string' },
-                      artistId: { type: 'string' },
-                      albumId: { type: 'string' },
-                      duration: { type: 'number' },
-                      filePath: { type: 'string' },
-                      fileSize: { type: 'number' },
-                      youtubeId: { type: 'string' },
-                      likeability: { type: 'number' }
-                    }
-                  }
+                  items: TRACK_SCHEMA
                 },
                 totalArtists: { type: 'number' },
                 totalAlbums: { type: 'number' },
@@ -169,22 +204,7 @@ export async function playbackRoutes(fastify: FastifyInstance): Promise<void> {
             success: { type: 'boolean' },
             tracks: {
               type: 'array',
-              items: {
-                type: 'object',
-                properties: {
-                  id: { type: 'string' },
-                  title: { type: 'string' },
-                  artist: { type: 'string' },
-                  album: { type: 'string' },
-                  artistId: { type: 'string' },
-                  albumId: { type: 'string' },
-                  duration: { type: 'number' },
-                  filePath: { type: 'string' },
-                  fileSize: { type: 'number' },
-                  youtubeId: { type: 'string' },
-                  likeability: { type: 'number' }
-                }
-              }
+              items: TRACK_SCHEMA
             }
           }
         }
@@ -230,22 +250,7 @@ export async function playbackRoutes(fastify: FastifyInstance): Promise<void> {
             success: { type: 'boolean' },
             tracks: {
               type: 'array',
-              items: {
-                type: 'object',
-                properties: {
-                  id: { type: 'string' },
-                  title: { type: 'string' },
-                  artist: { type: 'string' },
-                  album: { type: 'string' },
-                  artistId: { type: 'string' },
-                  albumId: { type: 'string' },
-                  duration: { type: 'number' },
-                  filePath: { type: 'string' },
-                  fileSize: { type: 'number' },
-                  youtubeId: { type: 'string' },
-                  likeability: { type: 'number' }
-                }
-              }
+              items: TRACK_SCHEMA
             }
           }
         }
@@ -293,22 +298,7 @@ export async function playbackRoutes(fastify: FastifyInstance): Promise<void> {
             success: { type: 'boolean' },
             tracks: {
               type: 'array',
-              items: {
-                type: 'object',
-                properties: {
-                  id: { type: 'string' },
-                  title: { type: 'string' },
-                  artist: { type: 'string' },
-                  album: { type: 'string' },
-                  artistId: { type: 'string' },
-                  albumId: { type: 'string' },
-                  duration: { type: 'number' },
-                  filePath: { type: 'string' },
-                  fileSize: { type: 'number' },
-                  youtubeId: { type: 'string' },
-                  likeability: { type: 'number' }
-                }
-              }
+              items: TRACK_SCHEMA
             },
             total: { type: 'integer' },
             hasMore: { type: 'boolean' }
@@ -457,38 +447,23 @@ export async function playbackRoutes(fastify: FastifyInstance): Promise<void> {
     try {
       const { trackId } = request.params as { trackId: string };
 
-      const track = await prisma.track.findUnique({ where: { id: trackId } });
-      if (!track) {
-        return reply.code(404).send({ success: false, error: 'Track not found' });
-      }
-
       const updateData = {
         incorrectMatch: { set: true },
         incorrectFlaggedAt: { set: new Date() }
       } as Prisma.TrackUpdateInput;
 
-      await prisma.track.update({
-        where: { id: trackId },
-        data: updateData
-      });
-
-      const updatedTrack = await prisma.track.findUnique({
-        where: { id: trackId },
-        select: {
-          id: true,
-          title: true,
-          incorrectMatch: true,
-          incorrectFlaggedAt: true
-        }
-      });
+      const updatedTrack = await updateTrackOrNull(trackId, updateData);
+      if (!updatedTrack) {
+        return reply.code(404).send({ success: false, error: 'Track not found' });
+      }
 
       await playbackService.refreshTrack(trackId);
 
       console.log('[FLAG] Track marked incorrect', {
         trackId,
-        title: updatedTrack?.title,
-        incorrectMatch: updatedTrack?.incorrectMatch,
-        incorrectFlaggedAt: updatedTrack?.incorrectFlaggedAt,
+        title: updatedTrack.title,
+        incorrectMatch: updatedTrack.incorrectMatch,
+        incorrectFlaggedAt: updatedTrack.incorrectFlaggedAt,
       });
 
       return reply.send({ success: true });
@@ -534,38 +509,23 @@ export async function playbackRoutes(fastify: FastifyInstance): Promise<void> {
     try {
       const { trackId } = request.params as { trackId: string };
 
-      const track = await prisma.track.findUnique({ where: { id: trackId } });
-      if (!track) {
-        return reply.code(404).send({ success: false, error: 'Track not found' });
-      }
-
       const updateData = {
         incorrectMatch: { set: false },
         incorrectFlaggedAt: { set: null }
       } as Prisma.TrackUpdateInput;
 
-      await prisma.track.update({
-        where: { id: trackId },
-        data: updateData
-      });
-
-      const updatedTrack = await prisma.track.findUnique({
-        where: { id: trackId },
-        select: {
-          id: true,
-          title: true,
-          incorrectMatch: true,
-          incorrectFlaggedAt: true
-        }
-      });
+      const updatedTrack = await updateTrackOrNull(trackId, updateData);
+      if (!updatedTrack) {
+        return reply.code(404).send({ success: false, error: 'Track not found' });
+      }
 
       await playbackService.refreshTrack(trackId);
 
       console.log('[FLAG] Track flag cleared', {
         trackId,
-        title: updatedTrack?.title,
-        incorrectMatch: updatedTrack?.incorrectMatch,
-        incorrectFlaggedAt: updatedTrack?.incorrectFlaggedAt,
+        title: updatedTrack.title,
+        incorrectMatch: updatedTrack.incorrectMatch,
+        incorrectFlaggedAt: updatedTrack.incorrectFlaggedAt,
       });
 
       return reply.send({ success: true });
@@ -589,22 +549,7 @@ export async function playbackRoutes(fastify: FastifyInstance): Promise<void> {
           type: 'object',
           properties: {
             success: { type: 'boolean' },
-            track: {
-              type: 'object',
-              properties: {
-                id: { type: 'string' },
-                title: { type: 'string' },
-                artist: { type: 'string' },
-                album: { type: 'string' },
-                artistId: { type: 'string' },
-                albumId: { type: 'string' },
-                duration: { type: 'number' },
-                filePath: { type: 'string' },
-                fileSize: { type: 'number' },
-                youtubeId: { type: 'string' },
-                likeability: { type: 'number' }
-              }
-            }
+            track: TRACK_SCHEMA
           }
         },
         404: {
@@ -719,7 +664,7 @@ export async function playbackRoutes(fastify: FastifyInstance): Promise<void> {
         });
       }
 
-      if (!fs.existsSync(trackRecord.filePath)) {
+      if (!(await statFile(trackRecord.filePath))) {
         console.warn('[playback] File missing on disk', { trackId, filePath: trackRecord.filePath });
         return reply.code(404).send({
           success: false,
@@ -1188,16 +1133,25 @@ export async function playbackRoutes(fastify: FastifyInstance): Promise<void> {
     try {
       const state = playbackService.getPlaybackState();
 
-      // If there's a current track, fetch full track info with artist/album names
+      // Fetch the current track and the queue with artist/album names in a single joined query
+      const trackIds = state.queue.map(track => track.id);
+      if (state.currentTrack) {
+        trackIds.push(state.currentTrack.id);
+      }
+      const trackRecords = trackIds.length > 0
+        ? await prisma.track.findMany({
+            where: { id: { in: trackIds } },
+            include: {
+              artist: true,
+              album: true
+            }
+          })
+        : [];
+      const trackRecordsById = new Map(trackRecords.map(record => [record.id, record]));
+
       let currentTrackWithNames = null;
       if (state.currentTrack) {
-        const fullTrack = await prisma.track.findUnique({
-          where: { id: state.currentTrack.id },
-          include: {
-            artist: true,
-            album: true
-          }
-        });
+        const fullTrack = trackRecordsById.get(state.currentTrack.id);
 
         if (fullTrack) {
           const dbTrack = fullTrack as { incorrectMatch?: boolean | null; incorrectFlaggedAt?: Date | null };
@@ -1219,28 +1173,18 @@ export async function playbackRoutes(fastify: FastifyInstance): Promise<void> {
         }
       }
 
-      // Get queue with full track info
-      const queueWithNames = await Promise.all(
-        state.queue.map(async (track) => {
-          const fullTrack = await prisma.track.findUnique({
-            where: { id: track.id },
-            include: {
-              artist: true,
-              album: true
-            }
-          });
-
-          const dbTrack = fullTrack as { incorrectMatch?: boolean | null; incorrectFlaggedAt?: Date | null };
-          return {
-            id: track.id,
-            title: track.title,
-            artist: fullTrack?.artist?.name || 'Unknown Artist',
-            album: fullTrack?.album?.title || 'Unknown Album',
-            incorrectMatch: dbTrack?.incorrectMatch ?? false,
-            incorrectFlaggedAt: dbTrack?.incorrectFlaggedAt ?? null,
-          };
-        })
-      );
+      const queueWithNames = state.queue.map(track => {
+        const fullTrack = trackRecordsById.get(track.id);
+        const dbTrack = fullTrack as { incorrectMatch?: boolean | null; incorrectFlaggedAt?: Date | null } | undefined;
+        return {
+          id: track.id,
+          title: track.title,
+          artist: fullTrack?.artist?.name || 'Unknown Artist',
+          album: fullTrack?.album?.title || 'Unknown Album',
+          incorrectMatch: dbTrack?.incorrectMatch ?? false,
+          incorrectFlaggedAt: dbTrack?.incorrectFlaggedAt ?? null,
+        };
+      });
 
       return reply.send({
         success: true,
@@ -1483,8 +1427,9 @@ export async function playbackRoutes(fastify: FastifyInstance): Promise<void> {
 
       const filePath = track.filePath;
 
-      // Check if file exists
-      if (!fs.existsSync(filePath)) {
+      // Check if file exists and get its stats for content length
+      const stat = await statFile(filePath);
+      if (!stat) {
         console.warn('[audio] 404: file missing on disk', { trackId, filePath });
         return reply.code(404).send({
           success: false,
@@ -1494,8 +1439,6 @@ export async function playbackRoutes(fastify: FastifyInstance): Promise<void> {
         });
       }
 
-      // Get file stats for content length
-      const stat = fs.statSync(filePath);
       const fileSize = stat.size;
 
       // Handle range requests for audio streaming
@@ -1,7 +1,5 @@
 import { FastifyInstance } from 'fastify';
 import WebSocketService from '../services/websocket.service';
-import { PlaybackService } from '../services/playback.service';
-import { PrismaClient } from '@prisma/client';
 /// <reference path="../types/fastify.d.ts" />
 
 /**
@@ -10,8 +8,7 @@ import { PrismaClient } from '@prisma/client';
  */
 export async function websocketRoutes(fastify: FastifyInstance): Promise<void> {
   // Get services from the app
-  const prisma = fastify.prisma as PrismaClient;
-  const playbackService = new PlaybackService(prisma);
+  const playbackService = fastify.playbackService;
   const websocketService = new WebSocketService();
 
   // Initialize WebSocket service with the Fastify server
@@ -237,12 +237,7 @@ export class DownloadService extends EventEmitter {
     if (!job) return false;
 
     // Cancel active download
-    const tracker = this.activeDownloads.get(jobId);
-    if (tracker) {
-      tracker.controller.abort();
-      if (tracker.watchdog) clearInterval(tracker.watchdog);
-      this.activeDownloads.delete(jobId);
-    }
+    this.releaseActiveDownload(jobId)?.controller.abort();
 
     // Mark as failed but keep in queue for potential retry
     this.updateJobStatus(jobId, 'failed');
@@ -420,6 +415,7 @@ export class DownloadService extends EventEmitter {
         },
         abortSignal: controller.signal as any,
         durationSeconds: videoInfo.duration || 0,
+        metadata: videoInfo,
       });
 
       if (result.success && result.metadata) {
@@ -506,9 +502,7 @@ export class DownloadService extends EventEmitter {
       if (job.errorCode !== undefined) failure.errorCode = job.errorCode;
       return failure;
     } finally {
-      const tracker = this.activeDownloads.get(jobId);
-      if (tracker?.watchdog) clearInterval(tracker.watchdog);
-      this.activeDownloads.delete(jobId);
+      this.releaseActiveDownload(jobId);
       // Process next item in queue
       this.processQueue();
     }
@@ -518,17 +512,13 @@ export class DownloadService extends EventEmitter {
    * Save track metadata to database
    */
   private async saveTrackToDatabase(metadata: any, filePath: string) {
-    // Find or create artist
-    let artist = await this.prisma.artist.findFirst({
+    // Artist names are unique, so one upsert replaces the find-then-create round trips
+    const artist = await this.prisma.artist.upsert({
       where: { name: metadata.artist },
+      update: {},
+      create: { name: metadata.artist },
     });
 
-    if (!artist) {
-      artist = await this.prisma.artist.create({
-        data: { name: metadata.artist },
-      });
-    }
-
     // Find or create album
     let album = await this.prisma.album.findFirst({
       where: {
@@ -546,42 +536,38 @@ export class DownloadService extends EventEmitter {
       });
     }
 
-    // If track with this youtubeId exists, update filePath/fileSize instead of creating new
-    let track = null as any;
-    if (metadata.youtubeId) {
-      track = await this.prisma.track.findFirst({ where: { youtubeId: metadata.youtubeId } });
-    }
-
     const fileSize = await (await FileUtils.getFileInfo(filePath))?.size || 0;
 
-    if (track) {
-      track = await this.prisma.track.update({
-        where: { id: track.id },
-        data: {
-          title: metadata.title,
-          artistId: artist.id,
-          albumId: album.id,
-          duration: metadata.duration,
-          filePath,
-          fileSize,
-          updatedAt: new Date(),
-        },
-      });
-    } else {
-      track = await this.prisma.track.create({
-        data: {
-          title: metadata.title,
-          artistId: artist.id,
-          albumId: album.id,
-          duration: metadata.duration,
-          filePath,
-          youtubeId: metadata.youtubeId,
-          fileSize,
-        },
+    const trackData = {
+      title: metadata.title,
+      artistId: artist.id,
+      albumId: album.id,
+      duration: metadata.duration,
+      filePath,
+      fileSize,
+    };
+
+    // If track with this youtubeId exists, update filePath/fileSize instead of creating new
+    if (metadata.youtubeId) {
+      return this.prisma.track.upsert({
+        where: { youtubeId: metadata.youtubeId },
+        update: trackData,
+        create: { ...trackData, youtubeId: metadata.youtubeId },
       });
     }
 
-    return track;
+    return this.prisma.track.create({ data: trackData });
+  }
+
+  /**
+   * Stop the stall watchdog and drop the active-download slot for a job
+   */
+  private releaseActiveDownload(jobId: string): ActiveDownloadTracker | undefined {
+    const tracker = this.activeDownloads.get(jobId);
+    if (!tracker) return undefined;
+    if (tracker.watchdog) clearInterval(tracker.watchdog);
+    this.activeDownloads.delete(jobId);
+    return tracker;
   }
 
   /**
@@ -740,8 +726,8 @@ export class DownloadService extends EventEmitter {
       if (type === 'started') {
         console.log(`[DOWNLOAD] Event: started job ${jobId}`);
       } else if (type === 'progress') {
-        const p = typeof data?.progress === 'number' ? `${data.progress}%` : '';
-        console.log(`[DOWNLOAD] Event: progress job ${jobId} ${p}`);
+        // Progress fires up to every 100ms; processDownload already logs it in 1% steps
+        return;
       } else if (type === 'completed') {
         console.log(`[DOWNLOAD] Event: completed job ${jobId}`);
       } else if (type === 'failed') {
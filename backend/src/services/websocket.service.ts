@@ -229,22 +229,26 @@ export class WebSocketService extends EventEmitter {
    */
   broadcast(message: WebSocketMessage, options: BroadcastOptions = {}): number {
     const { excludeClientId, includeOnlyClientIds } = options;
+    const includeOnly = includeOnlyClientIds ? new Set(includeOnlyClientIds) : null;
     let sentCount = 0;
+    // Serialize once; every recipient gets the same frame
+    let payload: string | null = null;
 
-    for (const [clientId, ws] of Array.from(this.clients.entries())) {
+    for (const [clientId, ws] of this.clients) {
       // Skip excluded client
       if (excludeClientId && clientId === excludeClientId) {
         continue;
       }
 
       // Skip if not in include list
-      if (includeOnlyClientIds && !includeOnlyClientIds.includes(clientId)) {
+      if (includeOnly && !includeOnly.has(clientId)) {
         continue;
       }
 
       // Send message
       if (ws.readyState === WebSocket.OPEN) {
-        ws.send(JSON.stringify(message));
+        payload ??= JSON.stringify(message);
+        ws.send(payload);
         sentCount++;
       }
     }
@@ -1,10 +1,12 @@
 import { PrismaClient } from '@prisma/client';
 import { AudioAnalysisService } from '../services/audio-analysis.service';
+import { PlaybackService } from '../services/playback.service';
 
 // Augment FastifyInstance to include prisma property
 declare module 'fastify' {
   interface FastifyInstance {
     prisma: PrismaClient;
     audioAnalysisService: AudioAnalysisService;
+    playbackService: PlaybackService;
   }
 }
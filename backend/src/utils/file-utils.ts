@@ -1,8 +1,12 @@
-import { promises as fs, createReadStream } from 'fs';
+import { promises as fs, createReadStream, Dirent } from 'fs';
 import * as path from 'path';
 import { FileInfo } from '../types/api.types';
 import { env } from '../config/environment';
 
+// Audio file extensions recognized by the library helpers
+const MUSIC_EXTENSIONS = ['.mp3', '.m4a', '.flac', '.aac', '.ogg', '.wma'];
+const AUDIO_EXTENSIONS = new Set([...MUSIC_EXTENSIONS, '.wav']);
+
 export class FileUtils {
   /**
    * Ensure directory exists, creating it if necessary
@@ -46,27 +50,30 @@ export class FileUtils {
     const { recursive = false, extensions, excludeDirs = [] } = options;
 
     try {
-      const items = await fs.readdir(dirPath);
+      // Dirent types come from readdir itself, so only matching files need a stat
+      const entries = await fs.readdir(dirPath, { withFileTypes: true });
       const files: FileInfo[] = [];
 
-      for (const item of items) {
+      for (const entry of entries) {
+        const item = entry.name;
         const fullPath = path.join(dirPath, item);
-        const stats = await fs.stat(fullPath);
+        const { isDirectory, isFile } = await FileUtils.resolveEntryType(entry, fullPath);
 
         // Skip excluded directories
-        if (stats.isDirectory() && excludeDirs.includes(item)) {
+        if (isDirectory && excludeDirs.includes(item)) {
           continue;
         }
 
         // Handle recursive listing
-        if (stats.isDirectory() && recursive) {
+        if (isDirectory && recursive) {
           const subFiles = await FileUtils.listFiles(fullPath, options);
           files.push(...subFiles);
         }
 
         // Filter by extensions if specified
-        if (stats.isFile()) {
+        if (isFile) {
           if (!extensions || extensions.some(ext => item.endsWith(ext))) {
+            const stats = await fs.stat(fullPath);
             files.push({
               path: fullPath,
               size: stats.size,
@@ -83,6 +90,17 @@ export class FileUtils {
     }
   }
 
+  /**
+   * Resolve a directory entry's type, only stat-ing symlinks so they are followed as before
+   */
+  private static async resolveEntryType(entry: Dirent, fullPath: string): Promise<{ isDirectory: boolean; isFile: boolean }> {
+    if (!entry.isSymbolicLink()) {
+      return { isDirectory: entry.isDirectory(), isFile: entry.isFile() };
+    }
+    const stats = await fs.stat(fullPath);
+    return { isDirectory: stats.isDirectory(), isFile: stats.isFile() };
+  }
+
   /**
    * Create organized directory structure for music files
    */
@@ -120,16 +138,16 @@ export class FileUtils {
   static async getDirectorySize(dirPath: string): Promise<number> {
     try {
       let totalSize = 0;
-      const items = await fs.readdir(dirPath);
+      const entries = await fs.readdir(dirPath, { withFileTypes: true });
 
-      for (const item of items) {
-        const fullPath = path.join(dirPath, item);
-        const stats = await fs.stat(fullPath);
+      for (const entry of entries) {
+        const fullPath = path.join(dirPath, entry.name);
+        const { isDirectory } = await FileUtils.resolveEntryType(entry, fullPath);
 
-        if (stats.isDirectory()) {
+        if (isDirectory) {
           totalSize += await FileUtils.getDirectorySize(fullPath);
         } else {
-          totalSize += stats.size;
+          totalSize += (await fs.stat(fullPath)).size;
         }
       }
 
@@ -144,13 +162,13 @@ export class FileUtils {
    */
   static async cleanEmptyDirectories(dirPath: string): Promise<void> {
     try {
-      const items = await fs.readdir(dirPath);
+      const entries = await fs.readdir(dirPath, { withFileTypes: true });
 
-      for (const item of items) {
-        const fullPath = path.join(dirPath, item);
-        const stats = await fs.stat(fullPath);
+      for (const entry of entries) {
+        const fullPath = path.join(dirPath, entry.name);
+        const { isDirectory } = await FileUtils.resolveEntryType(entry, fullPath);
 
-        if (stats.isDirectory()) {
+        if (isDirectory) {
           await FileUtils.cleanEmptyDirectories(fullPath);
           // Check if directory is now empty
           const remainingItems = await fs.readdir(fullPath);
@@ -202,10 +220,9 @@ export class FileUtils {
    * Get music files from download directory
    */
   static async getMusicFiles(): Promise<FileInfo[]> {
-    const musicExtensions = ['.mp3', '.m4a', '.flac', '.aac', '.ogg', '.wma'];
     return FileUtils.listFiles(env.DOWNLOAD_DIR, {
       recursive: true,
-      extensions: musicExtensions,
+      extensions: MUSIC_EXTENSIONS,
       excludeDirs: ['temp', 'cache', 'thumbs'],
     });
   }
@@ -236,8 +253,7 @@ export class FileUtils {
    * Check if file is audio file
    */
   static isAudioFile(filePath: string): boolean {
-    const audioExtensions = ['.mp3', '.m4a', '.flac', '.aac', '.ogg', '.wma', '.wav'];
-    return audioExtensions.includes(FileUtils.getFileExtension(filePath));
+    return AUDIO_EXTENSIONS.has(FileUtils.getFileExtension(filePath));
   }
 
   /**
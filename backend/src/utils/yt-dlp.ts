@@ -185,11 +185,12 @@ export class YTDlpWrapper {
   /**
    * Download audio and report progress via callback.
    * The onProgress callback will receive percentage [0-100].
+   * Pass ctx.metadata when the caller already fetched it to skip a second yt-dlp lookup.
    */
   static async downloadAudioWithProgress(
     url: string,
     options: DownloadOptions,
-    ctx?: { onProgress?: (percent: number, raw?: string) => void; abortSignal?: AbortSignal; durationSeconds?: number }
+    ctx?: { onProgress?: (percent: number, raw?: string) => void; abortSignal?: AbortSignal; durationSeconds?: number; metadata?: TrackMetadata }
   ): Promise<DownloadResult> {
     try {
       const outputDir = options.outputDir || env.DOWNLOAD_DIR;
@@ -269,7 +270,7 @@ export class YTDlpWrapper {
 
       await subprocess; // wait until finished
 
-      const metadata = await YTDlpWrapper.extractMetadata(url);
+      const metadata = ctx?.metadata ?? await YTDlpWrapper.extractMetadata(url, options.extractorArgs);
       return {
         success: true,
         filePath: ytdlpOptions.output,
@@ -461,6 +462,10 @@ export class YTDlpWrapper {
    * Check if URL is a playlist
    */
   static async isPlaylist(url: string): Promise<boolean> {
+    // A list= parameter is conclusive (yesPlaylist makes yt-dlp treat it as a playlist),
+    // so skip the network probe for the common case
+    if (YTDlpWrapper.hasListParam(url)) return true;
+
     try {
       const normalized = YTDlpWrapper.normalizeUrl(url);
       const result: any = await youtubedl(normalized, {
@@ -496,27 +501,15 @@ export class YTDlpWrapper {
     }
   }
 
-  /**
-   * Get download progress (this would need to be implemented with process spawning)
-   */
-  static async getDownloadProgress(jobId: string): Promise<number> {
-    // This is a placeholder - in a real implementation, you'd track
-    // the progress of spawned yt-dlp processes
-    console.log(`Getting progress for job ${jobId}`);
-    return 0;
-  }
-
-  /**
-   * Cancel download (this would need to be implemented with process management)
-   */
-  static async cancelDownload(jobId: string): Promise<boolean> {
-    // This is a placeholder - in a real implementation, you'd kill
-    // the corresponding yt-dlp process
-    console.log(`Cancelling download for job ${jobId}`);
-    return true;
+  // Private helper methods
+  private static hasListParam(input: string): boolean {
+    try {
+      return Boolean(new URL(input).searchParams.get('list'));
+    } catch {
+      return false;
+    }
   }
 
-  // Private helper methods
   private static mapQualityToNumber(quality: DownloadOptions['quality']): number {
     switch (quality) {
       case 'best': return 320;
@@ -63,10 +63,17 @@ async function testDatabase() {
     
     // Test 6: Count records
     console.log('\n6. Counting records...');
+    // One round trip for all three counts; COUNT(*) comes back as a BigInt
+    const [row] = await prisma.$queryRaw`
+      SELECT
+        (SELECT COUNT(*) FROM "artists") AS artists,
+        (SELECT COUNT(*) FROM "albums") AS albums,
+        (SELECT COUNT(*) FROM "tracks") AS tracks
+    `;
     const counts = {
-      artists: await prisma.artist.count(),
-      albums: await prisma.album.count(),
-      tracks: await prisma.track.count()
+      artists: Number(row.artists),
+      albums: Number(row.albums),
+      tracks: Number(row.tracks)
     };
     console.log('✅ Record counts:', counts);
     
@@ -1,6 +1,11 @@
 import { PrismaClient } from '@prisma/client';
 import { execSync } from 'child_process';
 import { join } from 'path';
+import { Track } from '../src/types/api.types';
+
+// Truncating in one statement avoids per-table DELETE round trips; CASCADE
+// also clears tables that reference tracks (analysis, ratings, sessions, ...)
+const TRUNCATE_SQL = 'TRUNCATE TABLE "tracks", "albums", "artists" RESTART IDENTITY CASCADE';
 
 export class TestDatabase {
   private static instance: PrismaClient;
@@ -22,9 +27,7 @@ export class TestDatabase {
         });
 
         // Clean database before tests
-        await this.instance.track.deleteMany();
-        await this.instance.artist.deleteMany();
-        await this.instance.album.deleteMany();
+        await this.truncateAll(this.instance);
 
       } catch (error) {
         console.error('Failed to setup test database:', error);
@@ -43,9 +46,41 @@ export class TestDatabase {
 
   static async clean(): Promise<void> {
     if (this.instance) {
-      await this.instance.track.deleteMany();
-      await this.instance.artist.deleteMany();
-      await this.instance.album.deleteMany();
+      await this.truncateAll(this.instance);
     }
   }
+
+  /**
+   * Insert a track together with its artist and album in one nested write
+   */
+  static async seedTrack(track: Track): Promise<void> {
+    await this.instance.artist.create({
+      data: {
+        id: track.artistId,
+        name: 'Test Artist',
+        albums: {
+          create: {
+            id: track.albumId,
+            title: 'Test Album',
+            tracks: {
+              create: {
+                id: track.id,
+                title: track.title,
+                artist: { connect: { id: track.artistId } },
+                duration: track.duration,
+                filePath: track.filePath,
+                fileSize: track.fileSize,
+                youtubeId: track.youtubeId ?? null,
+                likeability: track.likeability,
+              }
+            }
+          }
+        }
+      }
+    });
+  }
+
+  private static async truncateAll(client: PrismaClient): Promise<void> {
+    await client.$executeRawUnsafe(TRUNCATE_SQL);
+  }
 }
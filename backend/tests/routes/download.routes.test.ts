@@ -32,23 +32,20 @@ describe('Download Routes Integration Tests', () => {
 
   beforeAll(async () => {
     prisma = await TestDatabase.setup();
+
+    // Import and create app after mocks are set up
+    const { createApp } = await import('../test-app');
+    app = await createApp();
   });
 
   afterAll(async () => {
+    await app.close();
     await TestDatabase.teardown();
   });
 
   beforeEach(async () => {
     await TestDatabase.clean();
     jest.clearAllMocks();
-
-    // Import and create app after mocks are set up
-    const { createApp } = await import('../test-app');
-    app = await createApp();
-  });
-
-  afterEach(async () => {
-    await app.close();
   });
 
   describe('POST /download/audio', () => {
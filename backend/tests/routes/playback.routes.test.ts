@@ -2,7 +2,6 @@ import request from 'supertest';
 import { FastifyInstance } from 'fastify';
 import { TestDatabase } from '../database';
 import { TestDataFactory } from '../factory';
-import { PrismaClient } from '@prisma/client';
 import { jest } from '@jest/globals';
 
 // Mock the playback service
@@ -33,57 +32,31 @@ jest.mock('../../src/services/playback.service', () => ({
 
 describe('Playback Routes Integration Tests', () => {
   let app: FastifyInstance;
-  let prisma: PrismaClient;
   let mockTrack: any;
 
   beforeAll(async () => {
-    prisma = await TestDatabase.setup();
-  });
+    await TestDatabase.setup();
 
-  afterAll(async () => {
-    await TestDatabase.teardown();
-  });
-
-  beforeEach(async () => {
+    // Seed once: route handlers under test only read these rows, and
+    // playback mutations go through the mocked PlaybackService
     await TestDatabase.clean();
-    jest.clearAllMocks();
 
     // Create test data
     mockTrack = TestDataFactory.createTrack();
-    await prisma.artist.create({
-      data: {
-        id: mockTrack.artistId,
-        name: 'Test Artist',
-      }
-    });
-    await prisma.album.create({
-      data: {
-        id: mockTrack.albumId,
-        title: 'Test Album',
-        artistId: mockTrack.artistId,
-      }
-    });
-    await prisma.track.create({
-      data: {
-        id: mockTrack.id,
-        title: mockTrack.title,
-        artistId: mockTrack.artistId,
-        albumId: mockTrack.albumId,
-        duration: mockTrack.duration,
-        filePath: mockTrack.filePath,
-        fileSize: mockTrack.fileSize,
-        youtubeId: mockTrack.youtubeId,
-        likeability: mockTrack.likeability,
-      }
-    });
+    await TestDatabase.seedTrack(mockTrack);
 
     // Import and create app after mocks are set up
     const { createApp } = await import('../test-app');
     app = await createApp();
   });
 
-  afterEach(async () => {
+  afterAll(async () => {
     await app.close();
+    await TestDatabase.teardown();
+  });
+
+  beforeEach(() => {
+    jest.clearAllMocks();
   });
 
   describe('GET /tracks', () => {
@@ -2,7 +2,6 @@ import { WebSocket, WebSocketServer } from 'ws';
 import { FastifyInstance } from 'fastify';
 import { TestDatabase } from '../database';
 import { TestDataFactory } from '../factory';
-import { PrismaClient } from '@prisma/client';
 import { jest } from '@jest/globals';
 
 // Mock the playback service
@@ -53,45 +52,11 @@ describe('WebSocket Integration Tests', () => {
   let mockTrack: any;
 
   beforeAll(async () => {
-    const prisma = await TestDatabase.setup();
+    await TestDatabase.setup();
 
     // Create test data
     mockTrack = TestDataFactory.createTrack();
-    await prisma.artist.create({
-      data: {
-        id: mockTrack.artistId,
-        name: 'Test Artist',
-      }
-    });
-    await prisma.album.create({
-      data: {
-        id: mockTrack.albumId,
-        title: 'Test Album',
-        artistId: mockTrack.artistId,
-      }
-    });
-    await prisma.track.create({
-      data: {
-        id: mockTrack.id,
-        title: mockTrack.title,
-        artistId: mockTrack.artistId,
-        albumId: mockTrack.albumId,
-        duration: mockTrack.duration,
-        filePath: mockTrack.filePath,
-        fileSize: mockTrack.fileSize,
-        youtubeId: mockTrack.youtubeId,
-        likeability: mockTrack.likeability,
-      }
-    });
-  });
-
-  afterAll(async () => {
-    await TestDatabase.teardown();
-  });
-
-  beforeEach(async () => {
-    await TestDatabase.clean();
-    jest.clearAllMocks();
+    await TestDatabase.seedTrack(mockTrack);
 
     // Import and create app after mocks are set up
     const { createApp } = await import('../test-app');
@@ -102,9 +67,14 @@ describe('WebSocket Integration Tests', () => {
     wss = new WebSocketServer({ server });
   });
 
-  afterEach(async () => {
+  afterAll(async () => {
     wss.close();
     await app.close();
+    await TestDatabase.teardown();
+  });
+
+  beforeEach(() => {
+    jest.clearAllMocks();
   });
 
   describe('WebSocket Connection', () => {
@@ -141,15 +111,36 @@ describe('WebSocket Integration Tests', () => {
   });
 
   describe('Command Handling', () => {
-    it('should handle play command', (done) => {
+    // Commands that map straight onto one PlaybackService call. Payload and
+    // expected arguments are thunks because mockTrack is only seeded in beforeAll.
+    const commandCases: Array<{
+      action: string;
+      payload: () => Record<string, unknown>;
+      method: keyof typeof mockPlaybackService;
+      args: () => unknown[];
+    }> = [
+      { action: 'play', payload: () => ({ trackId: mockTrack.id }), method: 'startPlayback', args: () => [mockTrack.id] },
+      { action: 'pause', payload: () => ({}), method: 'pausePlayback', args: () => [] },
+      { action: 'resume', payload: () => ({}), method: 'resumePlayback', args: () => [] },
+      { action: 'stop', payload: () => ({}), method: 'stopPlayback', args: () => [] },
+      { action: 'next', payload: () => ({}), method: 'playNext', args: () => [] },
+      { action: 'previous', payload: () => ({}), method: 'playPrevious', args: () => [] },
+      { action: 'seek', payload: () => ({ position: 60 }), method: 'seekTo', args: () => [60] },
+      { action: 'setVolume', payload: () => ({ volume: 75 }), method: 'setVolume', args: () => [75] },
+      { action: 'addToQueue', payload: () => ({ trackId: mockTrack.id, position: 1 }), method: 'addToQueue', args: () => [mockTrack.id, 1] },
+      { action: 'removeFromQueue', payload: () => ({ position: 2 }), method: 'removeFromQueue', args: () => [2] },
+      { action: 'clearQueue', payload: () => ({}), method: 'clearQueue', args: () => [] },
+    ];
+
+    it.each(commandCases)('should handle $action command', ({ action, payload, method, args }, done) => {
       const ws = new WebSocket('ws://localhost:3000/ws');
 
       ws.on('open', () => {
         const command = {
           type: 'command',
           payload: {
-            action: 'play',
-            trackId: mockTrack.id,
+            action,
+            ...payload(),
           },
           timestamp: new Date(),
         };
@@ -161,7 +152,7 @@ describe('WebSocket Integration Tests', () => {
         const response = JSON.parse(data.toString());
         expect(response.type).toBe('response');
         expect(response.success).toBe(true);
-        expect(mockPlaybackService.startPlayback).toHaveBeenCalledWith(mockTrack.id);
+        expect(mockPlaybackService[method]).toHaveBeenCalledWith(...args());
         ws.close();
         done();
       });
@@ -171,261 +162,6 @@ describe('WebSocket Integration Tests', () => {
       });
     });
 
-    it('should handle pause command', (done) => {
-      const ws = new WebSocket('ws://localhost:3000/ws');
-
-      ws.on('open', () => {
-        const command = {
-          type: 'command',
-          payload: {
-            action: 'pause',
-          },
-          timestamp: new Date(),
-        };
-
-        ws.send(JSON.stringify(command));
-      });
-
-      ws.on('message', (data) => {
-        const response = JSON.parse(data.toString());
-        expect(response.type).toBe('response');
-        expect(response.success).toBe(true);
-        expect(mockPlaybackService.pausePlayback).toHaveBeenCalled();
-        ws.close();
-        done();
-      });
-    });
-
-    it('should handle resume command', (done) => {
-      const ws = new WebSocket('ws://localhost:3000/ws');
-
-      ws.on('open', () => {
-        const command = {
-          type: 'command',
-          payload: {
-            action: 'resume',
-          },
-          timestamp: new Date(),
-        };
-
-        ws.send(JSON.stringify(command));
-      });
-
-      ws.on('message', (data) => {
-        const response = JSON.parse(data.toString());
-        expect(response.type).toBe('response');
-        expect(response.success).toBe(true);
-        expect(mockPlaybackService.resumePlayback).toHaveBeenCalled();
-        ws.close();
-        done();
-      });
-    });
-
-    it('should handle stop command', (done) => {
-      const ws = new WebSocket('ws://localhost:3000/ws');
-
-      ws.on('open', () => {
-        const command = {
-          type: 'command',
-          payload: {
-            action: 'stop',
-          },
-          timestamp: new Date(),
-        };
-
-        ws.send(JSON.stringify(command));
-      });
-
-      ws.on('message', (data) => {
-        const response = JSON.parse(data.toString());
-        expect(response.type).toBe('response');
-        expect(response.success).toBe(true);
-        expect(mockPlaybackService.stopPlayback).toHaveBeenCalled();
-        ws.close();
-        done();
-      });
-    });
-
-    it('should handle next command', (done) => {
-      const ws = new WebSocket('ws://localhost:3000/ws');
-
-      ws.on('open', () => {
-        const command = {
-          type: 'command',
-          payload: {
-            action: 'next',
-          },
-          timestamp: new Date(),
-        };
-
-        ws.send(JSON.stringify(command));
-      });
-
-      ws.on('message', (data) => {
-        const response = JSON.parse(data.toString());
-        expect(response.type).toBe('response');
-        expect(response.success).toBe(true);
-        expect(mockPlaybackService.playNext).toHaveBeenCalled();
-        ws.close();
-        done();
-      });
-    });
-
-    it('should handle previous command', (done) => {
-      const ws = new WebSocket('ws://localhost:3000/ws');
-
-      ws.on('open', () => {
-        const command = {
-          type: 'command',
-          payload: {
-            action: 'previous',
-          },
-          timestamp: new Date(),
-        };
-
-        ws.send(JSON.stringify(command));
-      });
-
-      ws.on('message', (data) => {
-        const response = JSON.parse(data.toString());
-        expect(response.type).toBe('response');
-        expect(response.success).toBe(true);
-        expect(mockPlaybackService.playPrevious).toHaveBeenCalled();
-        ws.close();
-        done();
-      });
-    });
-
-    it('should handle seek command', (done) => {
-      const ws = new WebSocket('ws://localhost:3000/ws');
-
-      ws.on('open', () => {
-        const command = {
-          type: 'command',
-          payload: {
-            action: 'seek',
-            position: 60,
-          },
-          timestamp: new Date(),
-        };
-
-        ws.send(JSON.stringify(command));
-      });
-
-      ws.on('message', (data) => {
-        const response = JSON.parse(data.toString());
-        expect(response.type).toBe('response');
-        expect(response.success).toBe(true);
-        expect(mockPlaybackService.seekTo).toHaveBeenCalledWith(60);
-        ws.close();
-        done();
-      });
-    });
-
-    it('should handle setVolume command', (done) => {
-      const ws = new WebSocket('ws://localhost:3000/ws');
-
-      ws.on('open', () => {
-        const command = {
-          type: 'command',
-          payload: {
-            action: 'setVolume',
-            volume: 75,
-          },
-          timestamp: new Date(),
-        };
-
-        ws.send(JSON.stringify(command));
-      });
-
-      ws.on('message', (data) => {
-        const response = JSON.parse(data.toString());
-        expect(response.type).toBe('response');
-        expect(response.success).toBe(true);
-        expect(mockPlaybackService.setVolume).toHaveBeenCalledWith(75);
-        ws.close();
-        done();
-      });
-    });
-
-    it('should handle addToQueue command', (done) => {
-      const ws = new WebSocket('ws://localhost:3000/ws');
-
-      ws.on('open', () => {
-        const command = {
-          type: 'command',
-          payload: {
-            action: 'addToQueue',
-            trackId: mockTrack.id,
-            position: 1,
-          },
-          timestamp: new Date(),
-        };
-
-        ws.send(JSON.stringify(command));
-      });
-
-      ws.on('message', (data) => {
-        const response = JSON.parse(data.toString());
-        expect(response.type).toBe('response');
-        expect(response.success).toBe(true);
-        expect(mockPlaybackService.addToQueue).toHaveBeenCalledWith(mockTrack.id, 1);
-        ws.close();
-        done();
-      });
-    });
-
-    it('should handle removeFromQueue command', (done) => {
-      const ws = new WebSocket('ws://localhost:3000/ws');
-
-      ws.on('open', () => {
-        const command = {
-          type: 'command',
-          payload: {
-            action: 'removeFromQueue',
-            position: 2,
-          },
-          timestamp: new Date(),
-        };
-
-        ws.send(JSON.stringify(command));
-      });
-
-      ws.on('message', (data) => {
-        const response = JSON.parse(data.toString());
-        expect(response.type).toBe('response');
-        expect(response.success).toBe(true);
-        expect(mockPlaybackService.removeFromQueue).toHaveBeenCalledWith(2);
-        ws.close();
-        done();
-      });
-    });
-
-    it('should handle clearQueue command', (done) => {
-      const ws = new WebSocket('ws://localhost:3000/ws');
-
-      ws.on('open', () => {
-        const command = {
-          type: 'command',
-          payload: {
-            action: 'clearQueue',
-          },
-          timestamp: new Date(),
-        };
-
-        ws.send(JSON.stringify(command));
-      });
-
-      ws.on('message', (data) => {
-        const response = JSON.parse(data.toString());
-        expect(response.type).toBe('response');
-        expect(response.success).toBe(true);
-        expect(mockPlaybackService.clearQueue).toHaveBeenCalled();
-        ws.close();
-        done();
-      });
-    });
-
     it('should handle getState command', (done) => {
       const mockState = {
         currentTrack: mockTrack,
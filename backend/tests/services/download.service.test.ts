@@ -239,10 +239,13 @@ describe('DownloadService', () => {
     it('should handle database errors', async () => {
       const options = TestDataFactory.createDownloadOptions();
 
-      // Mock Prisma to throw error
-      jest.spyOn(prisma.track, 'create').mockRejectedValue(new Error('Database error'));
+      // Mock Prisma to throw error; tracks with a youtubeId are written via upsert
+      const upsertSpy = jest.spyOn(prisma.track, 'upsert').mockRejectedValue(new Error('Database error'));
+      const createSpy = jest.spyOn(prisma.track, 'create').mockRejectedValue(new Error('Database error'));
 
       const result = await downloadService.downloadAudio(options.url, options);
+      upsertSpy.mockRestore();
+      createSpy.mockRestore();
 
       expect(result.success).toBe(false);
       expect(result.error).toContain('Database error');
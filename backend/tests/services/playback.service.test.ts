@@ -36,32 +36,7 @@ describe('PlaybackService', () => {
 
     // Create test data
     mockTrack = TestDataFactory.createTrack();
-    await prisma.artist.create({
-      data: {
-        id: mockTrack.artistId,
-        name: 'Test Artist',
-      }
-    });
-    await prisma.album.create({
-      data: {
-        id: mockTrack.albumId,
-        title: 'Test Album',
-        artistId: mockTrack.artistId,
-      }
-    });
-    await prisma.track.create({
-      data: {
-        id: mockTrack.id,
-        title: mockTrack.title,
-        artistId: mockTrack.artistId,
-        albumId: mockTrack.albumId,
-        duration: mockTrack.duration,
-        filePath: mockTrack.filePath,
-        fileSize: mockTrack.fileSize,
-        youtubeId: mockTrack.youtubeId,
-        likeability: mockTrack.likeability,
-      }
-    });
+    await TestDatabase.seedTrack(mockTrack);
 
     playbackService = new PlaybackService(prisma);
     jest.clearAllMocks();
@@ -5,6 +5,12 @@ import { jest } from '@jest/globals';
 process.env.NODE_ENV = 'test';
 process.env.LOG_LEVEL = 'error';
 
+// Route and service diagnostics log on every request; keep them out of test
+// runs unless explicitly requested with TEST_DIAG=1
+if (!process.env.TEST_DIAG) {
+  jest.spyOn(console, 'log').mockImplementation(() => {});
+}
+
 // Mock external dependencies
 jest.mock('youtube-dl-exec', () => ({
   default: jest.fn(),
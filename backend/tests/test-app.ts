@@ -2,26 +2,29 @@ import Fastify, { FastifyInstance } from 'fastify';
 import cors from '@fastify/cors';
 import websocket from '@fastify/websocket';
 import staticPlugin from '@fastify/static';
-import { PrismaClient } from '@prisma/client';
 import { env } from '../src/config/environment';
 import { downloadRoutes } from '../src/routes/download.routes';
 import { playbackRoutes } from '../src/routes/playback.routes';
 import { websocketRoutes } from '../src/routes/websocket.routes';
+import { PlaybackService } from '../src/services/playback.service';
 import * as path from 'path';
+import { TestDatabase } from './database';
 
 /**
- * Create a Fastify app instance for testing
+ * Create a Fastify app instance for testing; route suites create one in
+ * beforeAll and share it across their tests
  */
 export async function createApp(): Promise<FastifyInstance> {
   const app = Fastify({
     logger: false, // Disable logging in tests
   });
 
-  // Initialize Prisma client
-  const prisma = new PrismaClient();
+  // Shared TestDatabase client; TestDatabase.teardown() disconnects it
+  const prisma = await TestDatabase.setup();
 
   // Add Prisma to the app instance
   app.decorate('prisma', prisma);
+  app.decorate('playbackService', new PlaybackService(prisma));
 
   // Register plugins
   await app.register(cors, {
@@ -51,10 +54,5 @@ export async function createApp(): Promise<FastifyInstance> {
     };
   });
 
-  // Clean shutdown
-  app.addHook('onClose', async () => {
-    await prisma.$disconnect();
-  });
-
   return app;
 }